@@ -0,0 +1,334 @@
+"""
+Numba kernels for time series computations.
+
+This module contains compiled, single-pass routines operating on
+contiguous float64 NumPy arrays. They are used internally by the
+feature engineering and indicator classes.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _pct_change_njit(close: np.ndarray) -> np.ndarray:
+    """
+    Simple returns ``close[i] / close[i - 1] - 1``, NaN for the first element.
+
+    Parameters
+    ----------
+    close : numpy.ndarray
+        Contiguous float64 array of closing prices.
+
+    Returns
+    -------
+    numpy.ndarray
+        Simple returns.
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    out[0] = np.nan
+    for i in range(1, n):
+        out[i] = close[i] / close[i - 1] - 1.0
+    return out
+
+
+@njit(nogil=True, cache=True)
+def _welford_add(
+    val: float,
+    nobs: int,
+    mean: float,
+    ssqdm: float
+) -> tuple[int, float, float]:
+    if not np.isnan(val):
+        nobs += 1
+        delta = val - mean
+        mean += delta / nobs
+        ssqdm += delta * (val - mean)
+    return nobs, mean, ssqdm
+
+
+@njit(nogil=True, cache=True)
+def _welford_remove(
+    val: float,
+    nobs: int,
+    mean: float,
+    ssqdm: float
+) -> tuple[int, float, float]:
+    if not np.isnan(val):
+        nobs -= 1
+        if nobs:
+            delta = val - mean
+            mean -= delta / nobs
+            ssqdm -= delta * (val - mean)
+        else:
+            mean = 0.0
+            ssqdm = 0.0
+    return nobs, mean, ssqdm
+
+
+@njit(nogil=True, cache=True)
+def _welford_std(nobs: int, ssqdm: float, window: int) -> float:
+    if nobs >= window and nobs > 1:
+        return np.sqrt(max(ssqdm, 0.0) / (nobs - 1))
+    return np.nan
+
+
+@njit(nogil=True, cache=True)
+def _rolling_std_numba(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling sample standard deviation (ddof=1) in O(N).
+
+    The window mean and sum of squared deviations are updated online
+    (Welford) as values enter and leave the window. NaN values are
+    skipped; a result is emitted only when the window is fully populated,
+    matching ``Series.rolling(window).std()``.
+
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        Contiguous float64 input array.
+    window : int
+        Rolling window size.
+
+    Returns
+    -------
+    numpy.ndarray
+        Rolling standard deviation, NaN during warmup.
+    """
+    n = arr.shape[0]
+    out = np.empty(n, dtype=np.float64)
+
+    nobs = np.int64(0)
+    mean = 0.0
+    ssqdm = 0.0
+
+    for i in range(n):
+        if i >= window:
+            nobs, mean, ssqdm = _welford_remove(arr[i - window], nobs, mean, ssqdm)
+        nobs, mean, ssqdm = _welford_add(arr[i], nobs, mean, ssqdm)
+        out[i] = _welford_std(nobs, ssqdm, window)
+
+    return out
+
+
+@njit(nogil=True, cache=True)
+def _fused_features(
+    close: np.ndarray,
+    lags: np.ndarray,
+    window: int
+) -> np.ndarray:
+    """
+    Returns, rolling volatility and lagged closes in a single pass.
+
+    Parameters
+    ----------
+    close : numpy.ndarray
+        Contiguous float64 array of closing prices.
+    lags : numpy.ndarray
+        int64 array of positive lag periods.
+    window : int
+        Rolling window for the volatility of returns.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(n, 2 + len(lags))`` holding the return,
+        the volatility and one column per lag, NaN where undefined.
+    """
+    n = close.shape[0]
+    n_lags = lags.shape[0]
+    out = np.empty((n, 2 + n_lags), dtype=np.float64)
+
+    nobs = np.int64(0)
+    mean = 0.0
+    ssqdm = 0.0
+
+    for i in range(n):
+        ret = close[i] / close[i - 1] - 1.0 if i > 0 else np.nan
+        out[i, 0] = ret
+
+        if i >= window:
+            nobs, mean, ssqdm = _welford_remove(out[i - window, 0], nobs, mean, ssqdm)
+        nobs, mean, ssqdm = _welford_add(ret, nobs, mean, ssqdm)
+        out[i, 1] = _welford_std(nobs, ssqdm, window)
+
+        for k in range(n_lags):
+            lag = lags[k]
+            out[i, 2 + k] = close[i - lag] if i >= lag else np.nan
+
+    return out
+
+
+@njit(cache=True)
+def _ewm_step(
+    avg: float,
+    old_wt: float,
+    val: float,
+    alpha: float
+) -> tuple[float, float]:
+    """
+    One step of ``ewm(alpha=alpha, adjust=False).mean()``.
+
+    Mirrors pandas with ``ignore_na=False``: the average is seeded with
+    the first non-NaN value, NaN inputs repeat it, and the weight of the
+    old average keeps decaying across the gap.
+    """
+    if np.isnan(avg):
+        if not np.isnan(val):
+            avg = val
+        return avg, old_wt
+
+    old_wt *= 1.0 - alpha
+    if not np.isnan(val):
+        avg = (old_wt * avg + alpha * val) / (old_wt + alpha)
+        old_wt = 1.0
+    return avg, old_wt
+
+
+@njit(cache=True)
+def _ema(x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponential moving average, ``adjust=False`` convention.
+
+    NaN handling follows ``ewm(adjust=False).mean()`` (see ``_ewm_step``).
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Contiguous float64 input array.
+    alpha : float
+        Smoothing factor, ``2 / (span + 1)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        EMA values.
+    """
+    n = x.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    avg = np.nan
+    old_wt = 1.0
+
+    for i in range(n):
+        avg, old_wt = _ewm_step(avg, old_wt, x[i], alpha)
+        out[i] = avg
+
+    return out
+
+
+@njit(cache=True)
+def _rsi_wilder(close: np.ndarray, window: int) -> np.ndarray:
+    """
+    Relative Strength Index with Wilder's smoothing.
+
+    Average gain and loss are seeded with the simple mean of the first
+    ``window`` price changes and then updated recursively as
+    ``avg = (avg * (window - 1) + value) / window``.
+
+    Price changes involving a NaN close are skipped: they do not update
+    the averages and the RSI is NaN at those positions.
+
+    Parameters
+    ----------
+    close : numpy.ndarray
+        Contiguous float64 array of closing prices.
+    window : int
+        Smoothing period.
+
+    Returns
+    -------
+    numpy.ndarray
+        RSI values, NaN until ``window`` valid price changes are seen.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+
+    nobs = 0
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if np.isnan(delta):
+            continue
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if nobs < window:
+            avg_gain += gain
+            avg_loss += loss
+            nobs += 1
+            if nobs < window:
+                continue
+            avg_gain /= window
+            avg_loss /= window
+        else:
+            avg_gain = (avg_gain * (window - 1) + gain) / window
+            avg_loss = (avg_loss * (window - 1) + loss) / window
+        out[i] = _rsi_value(avg_gain, avg_loss)
+
+    return out
+
+
+@njit(cache=True)
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else np.nan
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True)
+def _macd(
+    close: np.ndarray,
+    alpha_fast: float,
+    alpha_slow: float,
+    alpha_signal: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line, signal line and histogram in a single pass.
+
+    The fast, slow and signal EMAs are advanced together for each element,
+    with the same NaN handling as ``ewm(adjust=False).mean()``.
+
+    Parameters
+    ----------
+    close : numpy.ndarray
+        Contiguous float64 array of closing prices.
+    alpha_fast, alpha_slow, alpha_signal : float
+        Smoothing factors, ``2 / (span + 1)``.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        MACD line, signal line and histogram.
+    """
+    n = close.shape[0]
+    macd_out = np.empty(n, dtype=np.float64)
+    signal_out = np.empty(n, dtype=np.float64)
+    hist_out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return macd_out, signal_out, hist_out
+
+    ema_fast = np.nan
+    ema_slow = np.nan
+    ema_signal = np.nan
+    wt_fast = 1.0
+    wt_slow = 1.0
+    wt_signal = 1.0
+
+    for i in range(n):
+        c = close[i]
+        ema_fast, wt_fast = _ewm_step(ema_fast, wt_fast, c, alpha_fast)
+        ema_slow, wt_slow = _ewm_step(ema_slow, wt_slow, c, alpha_slow)
+        m = ema_fast - ema_slow
+        ema_signal, wt_signal = _ewm_step(ema_signal, wt_signal, m, alpha_signal)
+
+        macd_out[i] = m
+        signal_out[i] = ema_signal
+        hist_out[i] = m - ema_signal
+
+    return macd_out, signal_out, hist_out
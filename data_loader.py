@@ -2,16 +2,51 @@
 Module for loading historical stock market data.
 
 This module provides a class for downloading historical stock price data
-from Yahoo Finance using the yfinance library.
+from Yahoo Finance using the yfinance library. Downloads are cached in
+memory and on disk under ``~/.cache/marketanalyzer``.
 """
 
+import os
+import tempfile
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
 
+_CACHE_DIR = Path.home() / ".cache" / "marketanalyzer"
+_SHORT_TTL = 24 * 60 * 60
+_LONG_TTL = 7 * _SHORT_TTL
+_ALLOWED_PERIODS = frozenset({
+    "1d", "5d", "1mo", "3mo", "6mo",
+    "1y", "2y", "5y", "10y", "ytd", "max"
+})
+_LONG_PERIODS = frozenset({"1y", "2y", "5y", "10y", "max"})
+_REQUIRED_COLUMNS = frozenset({"Open", "High", "Low", "Close", "Volume"})
+
+# In-memory LRU of cache key -> (time the data was downloaded, frame).
+_MEMORY_CACHE: "OrderedDict[str, tuple[float, pd.DataFrame]]" = OrderedDict()
+_MEMORY_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=256)
+def _parse_ymd(value: str) -> datetime:
+    """
+    Parse a 'YYYY-MM-DD' string without going through strptime.
+    """
+    if (len(value) != 10 or value[4] != "-" or value[7] != "-"
+            or not value.isascii()
+            or not (value[:4] + value[5:7] + value[8:]).isdigit()):
+        raise ValueError(f"Invalid date: {value!r}")
+    return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
+
+
 class MarketDataLoader:
     """
     A class for loading historical market data for a given stock ticker.
@@ -28,11 +63,6 @@ class MarketDataLoader:
     >>> data.head()
     """
 
-    _ALLOWED_PERIODS = {
-        "1d", "5d", "1mo", "3mo", "6mo",
-        "1y", "2y", "5y", "10y", "ytd", "max"
-    }
-
     def __init__(self, ticker: str) -> None:
         self._validate_ticker(ticker)
         self.ticker = ticker.upper()
@@ -44,11 +74,18 @@ class MarketDataLoader:
         if not ticker.strip():
             raise ValueError("Ticker cannot be empty.")
 
+    @staticmethod
+    def _validate_period(period: str) -> None:
+        if period not in _ALLOWED_PERIODS:
+            raise ValueError(
+                f"Invalid period '{period}'. Allowed values: {sorted(_ALLOWED_PERIODS)}"
+            )
+
     @staticmethod
     def _validate_dates(start_date: str, end_date: str) -> None:
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
+            start = _parse_ymd(start_date)
+            end = _parse_ymd(end_date)
         except ValueError as exc:
             raise ValueError(
                 "Dates must be in 'YYYY-MM-DD' format."
@@ -57,34 +94,145 @@ class MarketDataLoader:
         if start >= end:
             raise ValueError("Start date must be earlier than end date.")
 
-    def _validate_dataframe(self, df: pd.DataFrame) -> None:
+    @staticmethod
+    def _validate_dataframe(df: pd.DataFrame) -> None:
         if df.empty:
             raise ValueError("No data returned for the given parameters.")
 
         if isinstance(df.columns, pd.MultiIndex):
             df.columns = df.columns.get_level_values(0)
 
-        required_columns = {"Open", "High", "Low", "Close", "Volume"}
-        if not required_columns.issubset(set(df.columns)):
+        missing = _REQUIRED_COLUMNS.difference(df.columns)
+        if missing:
             raise ValueError(
-                f"Downloaded data does not contain required columns: {required_columns}"
+                f"Downloaded data does not contain required columns: {sorted(missing)}"
             )
 
-    def load_by_period(self, period: str) -> pd.DataFrame:
-        if period not in self._ALLOWED_PERIODS:
-            raise ValueError(
-                f"Invalid period '{period}'. Allowed values: {self._ALLOWED_PERIODS}"
+    @staticmethod
+    def _to_column_blocks(df: pd.DataFrame) -> pd.DataFrame:
+        # One contiguous 1-D array per column so column-wise access
+        # does not stride across unrelated fields.
+        return pd.DataFrame(
+            {col: np.ascontiguousarray(df[col].to_numpy()) for col in df.columns},
+            index=df.index
+        )
+
+    def _cache_key(self, **kwargs: str) -> str:
+        params = {"auto_adjust": False, **kwargs}
+        parts = [f"{name}={params[name]}" for name in sorted(params)]
+        return "_".join([self.ticker, *parts])
+
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, path: Path) -> None:
+        # Write to a temporary file and rename it into place so an
+        # interrupted write never leaves a truncated cache file behind.
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
             )
+            os.close(fd)
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except (OSError, ImportError, ValueError):
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
-        df = yf.download(
-            tickers=self.ticker,
+    @staticmethod
+    def _fetch(key: str, ttl: float, **kwargs: str) -> pd.DataFrame:
+        now = time.time()
+        cached = _MEMORY_CACHE.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            _MEMORY_CACHE.move_to_end(key)
+            return cached[1]
+
+        path = _CACHE_DIR / f"{key}.parquet"
+        df = None
+        try:
+            fetched_at = path.stat().st_mtime
+            if now - fetched_at < ttl:
+                df = MarketDataLoader._to_column_blocks(pd.read_parquet(path))
+        except (OSError, ImportError, ValueError):
+            # Missing, unreadable or corrupt cache file: download instead.
+            df = None
+
+        if df is None:
+            df = yf.download(auto_adjust=False, progress=False, **kwargs)
+            MarketDataLoader._validate_dataframe(df)
+            df = MarketDataLoader._to_column_blocks(df)
+            fetched_at = now
+            MarketDataLoader._write_cache(df, path)
+
+        _MEMORY_CACHE[key] = (fetched_at, df)
+        _MEMORY_CACHE.move_to_end(key)
+        if len(_MEMORY_CACHE) > _MEMORY_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
+        return df
+
+    @classmethod
+    def load_many(
+        cls,
+        tickers: list[str],
+        period: str
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Download several tickers with a single threaded yfinance request.
+
+        Parameters
+        ----------
+        tickers : list of str
+            Stock ticker symbols.
+        period : str
+            Data period, one of the values accepted by ``load_by_period``.
+
+        Returns
+        -------
+        dict of str to pandas.DataFrame
+            OHLCV data keyed by upper-cased ticker.
+
+        Examples
+        --------
+        >>> frames = MarketDataLoader.load_many(["AAPL", "MSFT"], "1y")
+        >>> frames["MSFT"].head()
+        """
+        for ticker in tickers:
+            cls._validate_ticker(ticker)
+        cls._validate_period(period)
+
+        symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        raw = yf.download(
+            tickers=" ".join(symbols),
             period=period,
             auto_adjust=False,
-            progress=False
+            progress=False,
+            threads=True,
+            group_by="ticker"
         )
 
-        self._validate_dataframe(df)
-        return df
+        frames = {}
+        for symbol in symbols:
+            if symbol not in raw.columns.get_level_values(0):
+                raise ValueError(f"No data returned for ticker '{symbol}'.")
+            df = raw[symbol].dropna(how="all")
+            cls._validate_dataframe(df)
+            frames[symbol] = cls._to_column_blocks(df)
+        return frames
+
+    def load_by_period(self, period: str) -> pd.DataFrame:
+        self._validate_period(period)
+
+        ttl = _LONG_TTL if period in _LONG_PERIODS else _SHORT_TTL
+        df = self._fetch(
+            self._cache_key(period=period),
+            ttl,
+            tickers=self.ticker,
+            period=period
+        )
+        return df.copy()
 
     def load_by_dates(
         self,
@@ -93,13 +241,11 @@ class MarketDataLoader:
     ) -> pd.DataFrame:
         self._validate_dates(start_date, end_date)
 
-        df = yf.download(
+        df = self._fetch(
+            self._cache_key(start=start_date, end=end_date),
+            _SHORT_TTL,
             tickers=self.ticker,
             start=start_date,
-            end=end_date,
-            auto_adjust=False,
-            progress=False
+            end=end_date
         )
-
-        self._validate_dataframe(df)
-        return df
+        return df.copy()
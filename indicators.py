@@ -1,5 +1,9 @@
 import pandas as pd
 import numpy as np
+from numba import float64, int64
+from numba.experimental import jitclass
+
+from _kernels import _ema, _macd, _rsi_value, _rsi_wilder
 
 
 class TechnicalIndicators:
@@ -16,9 +20,9 @@ class TechnicalIndicators:
         ----------
         data : pandas.DataFrame
             DataFrame containing market data with at least
-            a 'Close' price column.
+            a 'Close' price column. It is used without copying.
         """
-        self.data = data.copy()
+        self.data = data
         self._validate()
 
     def _validate(self) -> None:
@@ -55,7 +59,21 @@ class TechnicalIndicators:
         if not isinstance(window, int) or window <= 0:
             raise ValueError("Window must be a positive integer.")
 
-        return self.data["Close"].rolling(window=window).mean()
+        close = self.data["Close"].to_numpy(dtype=np.float64)
+        missing = np.isnan(close)
+        csum = np.empty(len(close) + 1)
+        csum[0] = 0.0
+        np.cumsum(np.where(missing, 0.0, close), out=csum[1:])
+
+        sma = np.full(len(close), np.nan)
+        sma[window - 1:] = (csum[window:] - csum[:-window]) / window
+
+        if missing.any():
+            # Windows containing a NaN have no full average, as with rolling().
+            nan_count = np.concatenate(([0], np.cumsum(missing)))
+            sma[window - 1:][nan_count[window:] - nan_count[:-window] > 0] = np.nan
+
+        return pd.Series(sma, index=self.data.index, name=f"SMA_{window}")
 
     def ema(self, window: int) -> pd.Series:
         """
@@ -74,7 +92,14 @@ class TechnicalIndicators:
         if not isinstance(window, int) or window <= 0:
             raise ValueError("Window must be a positive integer.")
 
-        return self.data["Close"].ewm(span=window, adjust=False).mean()
+        close = np.ascontiguousarray(
+            self.data["Close"].to_numpy(dtype=np.float64)
+        )
+        return pd.Series(
+            _ema(close, 2.0 / (window + 1)),
+            index=self.data.index,
+            name=f"EMA_{window}"
+        )
 
     def rsi(self, window: int = 14) -> pd.Series:
         """
@@ -82,6 +107,8 @@ class TechnicalIndicators:
 
         RSI = 100 - (100 / (1 + RS))
 
+        Average gain and loss use Wilder's smoothing.
+
         Parameters
         ----------
         window : int, optional
@@ -95,17 +122,10 @@ class TechnicalIndicators:
         if not isinstance(window, int) or window <= 0:
             raise ValueError("Window must be a positive integer.")
 
-        delta = self.data["Close"].diff()
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-
-        avg_gain = gain.rolling(window).mean()
-        avg_loss = loss.rolling(window).mean()
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi
+        close = np.ascontiguousarray(
+            self.data["Close"].to_numpy(dtype=np.float64)
+        )
+        return pd.Series(_rsi_wilder(close, window), index=self.data.index)
 
     def macd(
         self,
@@ -133,15 +153,151 @@ class TechnicalIndicators:
         if not all(isinstance(x, int) and x > 0 for x in [fast, slow, signal]):
             raise ValueError("All periods must be positive integers.")
 
-        ema_fast = self.ema(fast)
-        ema_slow = self.ema(slow)
-
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-        histogram = macd_line - signal_line
+        close = np.ascontiguousarray(
+            self.data["Close"].to_numpy(dtype=np.float64)
+        )
+        macd_line, signal_line, histogram = _macd(
+            close,
+            2.0 / (fast + 1),
+            2.0 / (slow + 1),
+            2.0 / (signal + 1)
+        )
 
         return pd.DataFrame({
             "MACD": macd_line,
             "Signal": signal_line,
             "Histogram": histogram
-        })
+        }, index=self.data.index)
+
+
+_STREAMING_SPEC = [
+    ("sma_window", int64),
+    ("rsi_window", int64),
+    ("alpha_ema", float64),
+    ("alpha_fast", float64),
+    ("alpha_slow", float64),
+    ("alpha_signal", float64),
+    ("close_buf", float64[:]),
+    ("pos", int64),
+    ("count", int64),
+    ("sum", float64),
+    ("prev_close", float64),
+    ("ema", float64),
+    ("ema_fast", float64),
+    ("ema_slow", float64),
+    ("ema_signal", float64),
+    ("avg_gain", float64),
+    ("avg_loss", float64),
+]
+
+
+@jitclass(_STREAMING_SPEC)
+class StreamingIndicators:
+    """
+    Incrementally updated indicators for live price feeds.
+
+    Keeps O(window) state (a ring buffer for the SMA plus running
+    averages) so each new price is processed in O(1). Values match
+    the corresponding ``TechnicalIndicators`` methods on the same
+    price history. Prices must be finite.
+
+    Parameters
+    ----------
+    sma_window : int
+        SMA period.
+    ema_window : int
+        EMA period.
+    rsi_window : int
+        RSI period.
+    fast, slow, signal : int
+        MACD periods.
+
+    Examples
+    --------
+    >>> stream = StreamingIndicators(20, 20, 14, 12, 26, 9)
+    >>> for price in prices:
+    ...     sma, ema, rsi, macd, signal, hist = stream.push(price)
+    """
+
+    def __init__(
+        self,
+        sma_window: int = 20,
+        ema_window: int = 20,
+        rsi_window: int = 14,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9
+    ):
+        if min(sma_window, ema_window, rsi_window, fast, slow, signal) <= 0:
+            raise ValueError("All periods must be positive integers.")
+
+        self.sma_window = sma_window
+        self.rsi_window = rsi_window
+        self.alpha_ema = 2.0 / (ema_window + 1)
+        self.alpha_fast = 2.0 / (fast + 1)
+        self.alpha_slow = 2.0 / (slow + 1)
+        self.alpha_signal = 2.0 / (signal + 1)
+
+        self.close_buf = np.zeros(sma_window)
+        self.pos = 0
+        self.count = 0
+        self.sum = 0.0
+        self.prev_close = np.nan
+        self.ema = 0.0
+        self.ema_fast = 0.0
+        self.ema_slow = 0.0
+        self.ema_signal = 0.0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def push(self, price: float) -> tuple[float, float, float, float, float, float]:
+        """
+        Add a new price and return the updated indicator values.
+
+        Returns
+        -------
+        tuple of float
+            SMA, EMA, RSI, MACD line, signal line and histogram.
+            Values are NaN until enough prices have been seen.
+        """
+        self.count += 1
+
+        if self.count > self.sma_window:
+            self.sum -= self.close_buf[self.pos]
+        self.close_buf[self.pos] = price
+        self.sum += price
+        self.pos = (self.pos + 1) % self.sma_window
+        sma = self.sum / self.sma_window if self.count >= self.sma_window else np.nan
+
+        if self.count == 1:
+            self.ema = price
+            self.ema_fast = price
+            self.ema_slow = price
+        else:
+            self.ema += self.alpha_ema * (price - self.ema)
+            self.ema_fast += self.alpha_fast * (price - self.ema_fast)
+            self.ema_slow += self.alpha_slow * (price - self.ema_slow)
+        macd = self.ema_fast - self.ema_slow
+        self.ema_signal += self.alpha_signal * (macd - self.ema_signal)
+
+        rsi = np.nan
+        if self.count > 1:
+            delta = price - self.prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            window = self.rsi_window
+            if self.count <= window + 1:
+                # Seed with the simple mean of the first window changes.
+                self.avg_gain += gain
+                self.avg_loss += loss
+                if self.count == window + 1:
+                    self.avg_gain /= window
+                    self.avg_loss /= window
+                    rsi = _rsi_value(self.avg_gain, self.avg_loss)
+            else:
+                self.avg_gain = (self.avg_gain * (window - 1) + gain) / window
+                self.avg_loss = (self.avg_loss * (window - 1) + loss) / window
+                rsi = _rsi_value(self.avg_gain, self.avg_loss)
+        self.prev_close = price
+
+        return sma, self.ema, rsi, macd, self.ema_signal, macd - self.ema_signal
@@ -1,3 +1,40 @@
+import numpy as np
+
+
+# Indexed by decision code: 0 -> HOLD, 1 -> BUY, -1 -> SELL.
+_CODES = ("HOLD", "BUY", "SELL")
+
+
+def recommend_batch(
+    last_close: np.ndarray,
+    predicted: np.ndarray,
+    threshold: float = 0.01
+) -> np.ndarray:
+    """
+    Vectorized decisions for many (last close, prediction) pairs.
+
+    Parameters
+    ----------
+    last_close : numpy.ndarray
+        Last closing prices.
+    predicted : numpy.ndarray
+        Price forecasts, aligned with ``last_close``.
+    threshold : float
+        Minimum relative change to trigger BUY/SELL.
+
+    Returns
+    -------
+    numpy.ndarray
+        int8 codes: 1 for BUY, -1 for SELL, 0 for HOLD.
+    """
+    last_close = np.asarray(last_close, dtype=np.float64)
+    change = (np.asarray(predicted, dtype=np.float64) - last_close) / last_close
+    return (
+        (change > threshold).astype(np.int8)
+        - (change < -threshold).astype(np.int8)
+    )
+
+
 class TradingStrategy:
     """
     Simple decision based on predicted price vs last close
@@ -23,12 +60,15 @@ class TradingStrategy:
         """
         Returns:
             'BUY', 'SELL' or 'HOLD'
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> TradingStrategy(np.float64(100.0), 102.0).recommend()
+        'BUY'
+        >>> TradingStrategy(100.0, np.float64(98.0)).recommend()
+        'SELL'
         """
         change = (self.predicted_price - self.last_close) / self.last_close
-
-        if change > self.threshold:
-            return "BUY"
-        elif change < -self.threshold:
-            return "SELL"
-        else:
-            return "HOLD"
+        code = int(change > self.threshold) - int(change < -self.threshold)
+        return _CODES[code]
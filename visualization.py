@@ -1,5 +1,20 @@
+import numpy as np
 import pandas as pd
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+
+# Applied per figure via rc_context so other figures are unaffected.
+_RC_PARAMS = {
+    "agg.path.chunksize": 10_000,
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+}
+
+_MAX_POINTS = 4000
 
 
 def _validate_dataframe(df: pd.DataFrame, required_columns: set) -> None:
@@ -15,6 +30,119 @@ def _validate_dataframe(df: pd.DataFrame, required_columns: set) -> None:
         )
 
 
+def _m4_downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    buckets: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    M4 downsampling: keep the first, min, max and last point of each bucket.
+
+    Preserves the visual envelope of the series while reducing it to at
+    most ``4 * buckets`` points.
+    """
+    n = len(y)
+    if n <= 4 * buckets:
+        return x, y
+
+    edges = np.linspace(0, n, buckets + 1, dtype=np.int64)
+    keep = np.empty(4 * buckets, dtype=np.int64)
+
+    for b in range(buckets):
+        start, end = edges[b], edges[b + 1]
+        chunk = y[start:end]
+        keep[4 * b:4 * b + 4] = (
+            start,
+            start + np.argmin(chunk),
+            start + np.argmax(chunk),
+            end - 1
+        )
+
+    keep = np.unique(keep)
+    return x[keep], y[keep]
+
+
+def _x_values(index: pd.Index) -> np.ndarray:
+    """
+    Numeric x coordinates for an index.
+
+    Dates (and periods) become matplotlib date numbers, numeric indexes
+    are used as is, and any other index is plotted by position.
+    """
+    if isinstance(index, pd.PeriodIndex):
+        index = index.to_timestamp()
+    if isinstance(index, pd.DatetimeIndex):
+        return mdates.date2num(index.to_numpy())
+    if pd.api.types.is_numeric_dtype(index):
+        return index.to_numpy(dtype=np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+def _format_x_axis(ax: plt.Axes, index: pd.Index) -> None:
+    """
+    Label the x axis to match the coordinates from ``_x_values``.
+    """
+    if isinstance(index, (pd.DatetimeIndex, pd.PeriodIndex)):
+        ax.xaxis_date()
+    elif not pd.api.types.is_numeric_dtype(index):
+        labels = index.astype(str)
+        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.xaxis.set_major_formatter(FuncFormatter(
+            lambda pos, _: labels[int(pos)] if 0 <= pos < len(labels) else ""
+        ))
+
+
+def _finite_runs(
+    x: np.ndarray,
+    values: pd.Series
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Split a series into contiguous runs of finite values.
+
+    Each run is downsampled separately so the runs together keep roughly
+    ``_MAX_POINTS`` points, and lines are not drawn across gaps.
+    """
+    y = values.to_numpy(dtype=np.float64)
+    finite = np.concatenate(([False], np.isfinite(y), [False]))
+    edges = np.flatnonzero(finite[1:] != finite[:-1])
+    starts, ends = edges[::2], edges[1::2]
+
+    total = int((ends - starts).sum())
+    budget = _MAX_POINTS // 4
+    runs = []
+    for start, end in zip(starts, ends):
+        buckets = max(1, budget * (end - start) // total)
+        runs.append(_m4_downsample(x[start:end], y[start:end], buckets))
+    return runs
+
+
+def _add_lines(
+    ax: plt.Axes,
+    x: np.ndarray,
+    series: dict[str, pd.Series]
+) -> list[Line2D]:
+    """
+    Draw several series sharing one x array as a single LineCollection.
+
+    Returns legend handles, one per series.
+    """
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    segments = []
+    segment_colors = []
+    handles = []
+
+    for i, (label, values) in enumerate(series.items()):
+        color = colors[i % len(colors)]
+        for run in _finite_runs(x, values):
+            segments.append(np.column_stack(run))
+            segment_colors.append(color)
+        handles.append(Line2D([], [], color=color, label=label))
+
+    ax.add_collection(LineCollection(segments, colors=segment_colors))
+    ax.autoscale()
+    return handles
+
+
 def plot_price_with_ma(
     df: pd.DataFrame,
     ma_columns: list[str],
@@ -34,18 +162,21 @@ def plot_price_with_ma(
     """
     _validate_dataframe(df, {"Close", *ma_columns})
 
-    plt.figure(figsize=(12, 6))
-    plt.plot(df.index, df["Close"], label="Close Price")
-
-    for col in ma_columns:
-        plt.plot(df.index, df[col], label=col)
+    with plt.rc_context(_RC_PARAMS):
+        _, ax = plt.subplots(figsize=(12, 6))
+        x = _x_values(df.index)
+        _format_x_axis(ax, df.index)
+        handles = _add_lines(ax, x, {
+            "Close Price": df["Close"],
+            **{col: df[col] for col in ma_columns}
+        })
 
-    plt.title(title)
-    plt.xlabel("Date")
-    plt.ylabel("Price")
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+        plt.title(title)
+        plt.xlabel("Date")
+        plt.ylabel("Price")
+        plt.legend(handles=handles)
+        plt.grid(True)
+        plt.show()
 
 
 def plot_rsi(
@@ -58,18 +189,21 @@ def plot_rsi(
     """
     _validate_dataframe(df, {rsi_column})
 
-    plt.figure(figsize=(12, 4))
-    plt.plot(df.index, df[rsi_column], label="RSI")
+    with plt.rc_context(_RC_PARAMS):
+        _, ax = plt.subplots(figsize=(12, 4))
+        x = _x_values(df.index)
+        _format_x_axis(ax, df.index)
+        handles = _add_lines(ax, x, {"RSI": df[rsi_column]})
 
-    plt.axhline(70, linestyle="--")
-    plt.axhline(30, linestyle="--")
+        plt.axhline(70, linestyle="--")
+        plt.axhline(30, linestyle="--")
 
-    plt.title(title)
-    plt.xlabel("Date")
-    plt.ylabel("RSI")
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+        plt.title(title)
+        plt.xlabel("Date")
+        plt.ylabel("RSI")
+        plt.legend(handles=handles)
+        plt.grid(True)
+        plt.show()
 
 
 def plot_macd(
@@ -81,20 +215,28 @@ def plot_macd(
     """
     _validate_dataframe(macd_df, {"MACD", "Signal", "Histogram"})
 
-    plt.figure(figsize=(12, 5))
-
-    plt.plot(macd_df.index, macd_df["MACD"], label="MACD")
-    plt.plot(macd_df.index, macd_df["Signal"], label="Signal")
-
-    plt.bar(
-        macd_df.index,
-        macd_df["Histogram"],
-        alpha=0.3,
-        label="Histogram"
-    )
+    with plt.rc_context(_RC_PARAMS):
+        _, ax = plt.subplots(figsize=(12, 5))
+        x = _x_values(macd_df.index)
+        _format_x_axis(ax, macd_df.index)
+        handles = _add_lines(ax, x, {
+            "MACD": macd_df["MACD"],
+            "Signal": macd_df["Signal"]
+        })
+
+        runs = _finite_runs(x, macd_df["Histogram"])
+        hist_x = np.concatenate([run_x for run_x, _ in runs]) if runs else x[:0]
+        hist_y = np.concatenate([run_y for _, run_y in runs]) if runs else x[:0]
+        histogram = ax.vlines(
+            hist_x,
+            0,
+            hist_y,
+            alpha=0.3,
+            label="Histogram"
+        )
 
-    plt.title(title)
-    plt.xlabel("Date")
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+        plt.title(title)
+        plt.xlabel("Date")
+        plt.legend(handles=[*handles, histogram])
+        plt.grid(True)
+        plt.show()